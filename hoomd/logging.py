@@ -14,11 +14,12 @@ See Also:
     Tutorial: :doc:`tutorial/04-Custom-Actions-In-Python/00-index`
 """
 
-from copy import deepcopy
+import sys
+from copy import copy
 from enum import Flag, auto
 from itertools import count
 from functools import reduce, wraps
-from hoomd.util import dict_map, _SafeNamespaceDict
+from hoomd.util import _dict_unflatten, _SafeNamespaceDict
 from hoomd.error import DataAccessError
 from collections.abc import Sequence
 
@@ -206,8 +207,10 @@ class _LoggerQuantity:
         base_names={'update', 'tune', 'write'},
         skip_duplicates=True)
 
+    __slots__ = ('name', 'namespace', 'category', 'default', '_parent', '_leaf')
+
     def __init__(self, name, cls, category='scalar', default=True):
-        self.name = name
+        self.name = sys.intern(name)
         self.update_cls(cls)
         if isinstance(category, str):
             self.category = LoggerCategories[category]
@@ -228,13 +231,12 @@ class _LoggerQuantity:
         Yields:
             tuple[str]: A potential namespace for the object.
         """
-        if user_name is None:
-            namespace = self.namespace
-        else:
-            namespace = self.namespace[:-1] + (user_name,)
-        yield namespace + (self.name,)
+        name = self.name
+        parent = self._parent
+        leaf = self._leaf if user_name is None else user_name
+        yield parent + (leaf, name)
         for i in count(start=1, step=1):
-            yield namespace[:-1] + (namespace[-1] + '_' + str(i), self.name)
+            yield parent + (f"{leaf}_{i}", name)
 
     def update_cls(self, cls):
         """Allow updating the class/namespace of the object.
@@ -246,14 +248,20 @@ class _LoggerQuantity:
         Args:
             cls (``class object``): The class to update the namespace with.
         """
-        self.namespace = self._generate_namespace(cls)
+        namespace = self._generate_namespace(cls)
+        self.namespace = namespace
+        # Cache the split namespace used by yield_names.
+        self._parent = namespace[:-1]
+        self._leaf = namespace[-1]
         return self
 
     @classmethod
     def _generate_namespace(cls, loggable_cls):
         """Generate the namespace of a class given its module hierarchy."""
-        ns = tuple(loggable_cls.__module__.split('.'))
-        cls_name = loggable_cls.__name__
+        # Interned names let namespace comparisons short circuit on identity.
+        ns = tuple(
+            sys.intern(name) for name in loggable_cls.__module__.split('.'))
+        cls_name = sys.intern(loggable_cls.__name__)
         # Only filter namespaces of objects in the hoomd package
         if ns[0] == 'hoomd':
             return tuple(cls.namespace_filter(ns[1:])) + (cls_name,)
@@ -311,7 +319,9 @@ class Loggable(type):
         # take the one with the most priority in the mro. Also track if any
         # parent classes also have Loggable as a metaclass. This allows us to
         # know if we should error if a loggables method is defined. We also
-        # skip the first entry since that is the new_cls itself.
+        # skip the first entry since that is the new_cls itself. A shallow copy
+        # of each quantity suffices as update_cls only rebinds the namespace
+        # and all other attributes are immutable.
         inherited_loggables = dict()
         for base_cls in reversed(new_cls.__mro__[1:]):
             # The conditional checks if the type of one of the parent classes of
@@ -319,7 +329,7 @@ class Loggable(type):
             # or one of its subclasses.
             if issubclass(type(base_cls), Loggable):
                 inherited_loggables.update({
-                    name: deepcopy(quantity).update_cls(new_cls)
+                    name: copy(quantity).update_cls(new_cls)
                     for name, quantity in base_cls._export_dict.items()
                 })
         return inherited_loggables
@@ -526,6 +536,31 @@ class _LoggerEntry:
             for attr in ['obj', 'attr', 'category'])
 
 
+def _split_loggables(export_dict, names):
+    """Split names into loggable quantities and names that are not loggable.
+
+    Args:
+        export_dict (dict[str, _LoggerQuantity]): The loggable quantities.
+        names (Sequence[str]): The names to look up, or ``None`` for all
+            quantities.
+
+    Returns:
+        tuple[Iterable[_LoggerQuantity], list[str]]: The found quantities and
+        the names not found in ``export_dict``.
+    """
+    if names is None:
+        return export_dict.values(), []
+    log_quantities = []
+    bad_keys = []
+    for name in names:
+        quantity = export_dict.get(name)
+        if quantity is None:
+            bad_keys.append(name)
+        else:
+            log_quantities.append(quantity)
+    return log_quantities, bad_keys
+
+
 class Logger(_SafeNamespaceDict):
     """Logs HOOMD-blue operation data and custom quantities.
 
@@ -632,18 +667,15 @@ class Logger(_SafeNamespaceDict):
                 yield quantity
 
     def _get_loggables_by_name(self, obj, quantities):
-        if quantities is None:
-            yield from self._filter_quantities(obj._export_dict.values())
-        else:
+        if quantities is not None:
             quantities = self._wrap_quantity(quantities)
-            bad_keys = [q for q in quantities if q not in obj._export_dict]
-            # ensure all keys are valid
-            if bad_keys != []:
-                raise ValueError(
-                    "object {} has not loggable quantities {}.".format(
-                        obj, bad_keys))
-            yield from self._filter_quantities(
-                map(lambda q: obj._export_dict[q], quantities))
+        log_quantities, bad_keys = _split_loggables(obj._export_dict,
+                                                    quantities)
+        # ensure all keys are valid
+        if bad_keys:
+            raise ValueError("object {} has not loggable quantities {}.".format(
+                obj, bad_keys))
+        yield from self._filter_quantities(log_quantities)
 
     def add(self, obj, quantities=None, user_name=None):
         """Add loggables from obj to logger.
@@ -787,7 +819,8 @@ class Logger(_SafeNamespaceDict):
             `LoggerCategories` enum value use
             ``LoggerCategories[category]``.
         """
-        return dict_map(self._dict, lambda x: x())
+        return _dict_unflatten(
+            (namespace, entry()) for namespace, entry in self._flat.items())
 
     def _contains_obj(self, namespace, obj):
         """Evaluates based on identity."""
@@ -807,4 +840,4 @@ class Logger(_SafeNamespaceDict):
             return NotImplemented
         return (self.categories == other.categories
                 and self.only_default == other.only_default
-                and self._dict == other._dict)
+                and self._flat == other._flat)
@@ -1,6 +1,7 @@
 # Copyright (c) 2009-2022 The Regents of the University of Michigan.
 # Part of HOOMD-blue, released under the BSD 3-Clause License.
 
+import math
 import hoomd
 import pytest
 import numpy
@@ -60,6 +61,24 @@ angle_test_parameters = [
 ]
 
 
+def _triplet_positions(d, theta_deg, dimensions):
+    """Positions of three particles with the given bond length and angle."""
+    theta_rad = theta_deg * (math.pi / 180)
+    # scalar math functions avoid numpy ufunc dispatch overhead
+    x = d * math.sin(theta_rad / 2)
+    y = d * math.cos(theta_rad / 2)
+    positions = numpy.array([
+        [-x, y, 0.0],
+        [0.0, 0.0, 0.0],
+        [x, y, 0.0],
+    ])
+    # move particles slightly in direction of MPI decomposition which varies
+    # by simulation dimension
+    nudge_dimension = 2 if dimensions == 3 else 1
+    positions[:, nudge_dimension] += 0.1
+    return positions
+
+
 @pytest.fixture(scope='session')
 def triplet_snapshot_factory(device):
 
@@ -68,7 +87,6 @@ def triplet_snapshot_factory(device):
                       particle_types=['A'],
                       dimensions=3,
                       L=20):
-        theta_rad = theta_deg * (numpy.pi / 180)
         snapshot = hoomd.Snapshot(device.communicator)
         N = 3
         if snapshot.communicator.rank == 0:
@@ -78,23 +96,8 @@ def triplet_snapshot_factory(device):
             snapshot.configuration.box = box
             snapshot.particles.N = N
 
-            base_positions = numpy.array([
-                [
-                    -d * numpy.sin(theta_rad / 2), d * numpy.cos(theta_rad / 2),
-                    0.0
-                ],
-                [0.0, 0.0, 0.0],
-                [
-                    d * numpy.sin(theta_rad / 2),
-                    d * numpy.cos(theta_rad / 2),
-                    0.0,
-                ],
-            ])
-            # move particles slightly in direction of MPI decomposition which
-            # varies by simulation dimension
-            nudge_dimension = 2 if dimensions == 3 else 1
-            base_positions[:, nudge_dimension] += 0.1
-            snapshot.particles.position[:] = base_positions
+            snapshot.particles.position[:] = _triplet_positions(
+                d, theta_deg, dimensions)
             snapshot.particles.types = particle_types
             snapshot.angles.N = 1
             snapshot.angles.types = ['A-A-A']
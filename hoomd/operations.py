@@ -13,7 +13,6 @@ added and removed from a `Simulation`.
 
 from collections.abc import Collection
 from copy import copy
-from itertools import chain
 from hoomd.data import syncedlist
 from hoomd.operation import Writer, Updater, Tuner, Compute, Integrator
 from hoomd.tune import ParticleSorter
@@ -27,6 +26,21 @@ def _triggered_op_conversion(value):
     return (value._cpp_obj, value.trigger)
 
 
+def _cpp_obj_conversion(value):
+    """Convert an operation to its C++ object."""
+    return value._cpp_obj
+
+
+# Operation base classes paired with the `Operations` attribute that stores
+# them, in the order they are checked.
+_CONTAINER_ATTRS = (
+    (Updater, '_updaters'),
+    (Writer, '_writers'),
+    (Tuner, '_tuners'),
+    (Compute, '_computes'),
+)
+
+
 class Operations(Collection):
     """A mutable collection of operations which act on a `Simulation`.
 
@@ -67,24 +81,16 @@ class Operations(Collection):
         self._updaters = syncedlist.SyncedList(Updater,
                                                _triggered_op_conversion)
         self._writers = syncedlist.SyncedList(Writer, _triggered_op_conversion)
-        self._tuners = syncedlist.SyncedList(
-            Tuner, syncedlist._PartialGetAttr('_cpp_obj'))
-        self._computes = syncedlist.SyncedList(
-            Compute, syncedlist._PartialGetAttr('_cpp_obj'))
+        self._tuners = syncedlist.SyncedList(Tuner, _cpp_obj_conversion)
+        self._computes = syncedlist.SyncedList(Compute, _cpp_obj_conversion)
         self._integrator = None
         self._tuners.append(ParticleSorter())
 
     def _get_proper_container(self, operation):
-        if isinstance(operation, Updater):
-            return self._updaters
-        elif isinstance(operation, Writer):
-            return self._writers
-        elif isinstance(operation, Tuner):
-            return self._tuners
-        elif isinstance(operation, Compute):
-            return self._computes
-        else:
-            raise TypeError(f"{type(operation)} is not a valid operation type.")
+        for base_cls, attr in _CONTAINER_ATTRS:
+            if isinstance(operation, base_cls):
+                return getattr(self, attr)
+        raise TypeError(f"{type(operation)} is not a valid operation type.")
 
     def add(self, operation):
         """Add an operation to this container.
@@ -189,17 +195,23 @@ class Operations(Collection):
         if not self._sys_init:
             raise RuntimeError("System not initialized yet")
         sim = self._simulation
-        if not (self.integrator is None or self.integrator._attached):
-            self._integrator._add(self._simulation)
-            self.integrator._attach()
-        if not self.updaters._synced:
-            self.updaters._sync(sim, sim._cpp_sys.updaters)
-        if not self.writers._synced:
-            self.writers._sync(sim, sim._cpp_sys.analyzers)
-        if not self.tuners._synced:
-            self.tuners._sync(sim, sim._cpp_sys.tuners)
-        if not self.computes._synced:
-            self.computes._sync(sim, sim._cpp_sys.computes)
+        integrator = self._integrator
+        if not (integrator is None or integrator._attached):
+            integrator._add(sim)
+            integrator._attach()
+        # Use the containers directly rather than through their properties.
+        # The C++ system lists are only fetched for containers that need to
+        # be synced.
+        updaters, writers = self._updaters, self._writers
+        tuners, computes = self._tuners, self._computes
+        if not updaters._synced:
+            updaters._sync(sim, sim._cpp_sys.updaters)
+        if not writers._synced:
+            writers._sync(sim, sim._cpp_sys.analyzers)
+        if not tuners._synced:
+            tuners._sync(sim, sim._cpp_sys.tuners)
+        if not computes._synced:
+            computes._sync(sim, sim._cpp_sys.computes)
         self._scheduled = True
 
     def _unschedule(self):
@@ -219,17 +231,28 @@ class Operations(Collection):
             operation: Returns whether this exact operation is
                 contained in the collection.
         """
-        return any(op is operation for op in self)
+        if operation is not None and operation is self._integrator:
+            return True
+        for container in (self._tuners, self._updaters, self._writers,
+                          self._computes):
+            for op in container:
+                if op is operation:
+                    return True
+        return False
 
     def __iter__(self):
         """Iterates through all contained operations."""
-        integrator = (self._integrator,) if self._integrator else []
-        yield from chain(self._tuners, self._updaters, integrator,
-                         self._writers, self._computes)
+        yield from self._tuners
+        yield from self._updaters
+        if self._integrator is not None:
+            yield self._integrator
+        yield from self._writers
+        yield from self._computes
 
     def __len__(self):
         """Return the number of operations contained in this collection."""
-        base_len = len(self._writers) + len(self._updaters) + len(self._tuners)
+        base_len = (len(self._writers) + len(self._updaters) + len(self._tuners)
+                    + len(self._computes))
         return base_len + (1 if self._integrator is not None else 0)
 
     @property
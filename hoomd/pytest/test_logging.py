@@ -4,7 +4,8 @@
 from hoomd.conftest import pickling_check
 from pytest import raises, fixture
 from hoomd.logging import (_LoggerQuantity, _SafeNamespaceDict, Logger,
-                           dict_map, Loggable, LoggerCategories, log)
+                           Loggable, LoggerCategories, log)
+from hoomd.util import dict_map
 
 
 class DummyNamespace:
@@ -152,7 +153,7 @@ def good_keys():
 class TestSafeNamespaceDict:
 
     def test_contains(self, namespace_dict, good_keys):
-        bad_keys = [('z', 'q'), dict(), ('f', 'g', 'h')]
+        bad_keys = [('z', 'q'), dict(), ('f', 'g', 'h'), (['a'],)]
         for key in good_keys:
             assert key in namespace_dict
             assert key in namespace_dict
@@ -164,9 +165,13 @@ class TestSafeNamespaceDict:
         nsdict = blank_namespace_dict
         nsdict['a'] = 5
         nsdict[('b', 'c')] = None
-        assert nsdict._dict['a'] == 5
-        assert isinstance(nsdict._dict['b'], dict)
-        assert nsdict._dict['b']['c'] is None
+        assert nsdict._flat[('a',)] == 5
+        assert ('b',) not in nsdict._flat
+        assert 'b' in nsdict
+        assert nsdict[('b',)] == {'c': None}
+        assert nsdict._flat[('b', 'c')] is None
+        with raises(KeyError):
+            nsdict[('a', 'b')] = 1
 
     def test_delitem(self, namespace_dict):
         keys = [('a', 'b', 'c'), 'a']
@@ -185,6 +190,23 @@ class TestSafeNamespaceDict:
         blank_namespace_dict['a'] = 1
         assert len(blank_namespace_dict) == 1
 
+    def test_iter(self, namespace_dict, good_keys):
+        assert set(namespace_dict) == {('a',), ('a', 'b'), ('a', 'b', 'c'),
+                                       ('a', 'd'), ('e',), ('f',), ('f', 'g')}
+        # Membership and keys agree.
+        keys = set(namespace_dict.keys())
+        assert all(key in namespace_dict for key in keys)
+        assert all(
+            namespace_dict.validate_namespace(key) in keys for key in good_keys)
+
+    def test_dict_value(self, blank_namespace_dict):
+        nsdict = blank_namespace_dict
+        nsdict['x'] = {'y': 1, 'z': {'w': 2}}
+        assert ('x', 'y') in nsdict
+        assert ('x', 'z', 'w') in nsdict
+        assert nsdict['x'] == {'y': 1, 'z': {'w': 2}}
+        assert len(nsdict) == 2
+
 
 # ------ Test Logger
 @fixture
@@ -267,14 +289,14 @@ class TestLogger:
         assert len(blank_logger) == 2
 
         # Test adding specific quantity
-        blank_logger._dict = dict()
+        blank_logger.clear()
         blank_logger.add(logged_obj, 'prop')
         expected_namespace = base_namespace + ('prop',)
         assert expected_namespace in blank_logger
         assert len(blank_logger) == 1
 
         # Test multiple quantities
-        blank_logger._dict = dict()
+        blank_logger.clear()
         blank_logger.add(logged_obj, ['prop', 'proplist'])
         expected_namespaces = [
             base_namespace + ('prop',), base_namespace + ('proplist',)
@@ -283,7 +305,7 @@ class TestLogger:
         assert len(blank_logger) == 2
 
         # Test with category
-        blank_logger._dict = dict()
+        blank_logger.clear()
         blank_logger._categories = LoggerCategories['scalar']
         blank_logger.add(logged_obj)
         expected_namespace = base_namespace + ('prop',)
@@ -369,10 +391,10 @@ class TestLogger:
 
     def test_iadd(self, blank_logger, logged_obj):
         blank_logger.add(logged_obj)
-        add_log = blank_logger._dict
-        blank_logger._dict = dict()
+        add_log = dict(blank_logger._flat)
+        blank_logger.clear()
         blank_logger += logged_obj
-        assert add_log == blank_logger._dict
+        assert add_log == blank_logger._flat
         assert len(blank_logger) == 2
 
     def test_isub(self, logged_obj, base_namespace):
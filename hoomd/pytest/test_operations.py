@@ -22,6 +22,10 @@ def test_len():
 
     assert len(operations) == 3
 
+    operations.computes.append(
+        hoomd.md.compute.ThermodynamicQuantities(hoomd.filter.All()))
+    assert len(operations) == 4
+
 
 def test_iter():
     operations = hoomd.Operations()
@@ -120,6 +120,31 @@ def _dict_flatten(value, key):
         return new_dict
 
 
+def _dict_unflatten(items, start=0):
+    """Build a nested mapping from flat tuple keys.
+
+    The inverse of `dict_flatten`.
+
+    Args:
+        items (Iterable[tuple[tuple, Any]]): The (key, value) pairs to nest.
+        start (int, optional): The number of leading key entries to drop,
+            defaults to 0.
+
+    Returns:
+        dict: The nested mapping as a `dict`.
+    """
+    new_dict = dict()
+    for key, value in items:
+        parent_dict = new_dict
+        for name in key[start:-1]:
+            child_dict = parent_dict.get(name)
+            if child_dict is None:
+                child_dict = parent_dict[name] = dict()
+            parent_dict = child_dict
+        parent_dict[key[-1]] = value
+    return new_dict
+
+
 def dict_filter(dict_, filter_):
     r"""Perform a recursive filter on a nested mapping.
 
@@ -150,41 +175,59 @@ def dict_filter(dict_, filter_):
     return new_dict
 
 
-def _keys_helper(dict_, key=()):
-    for k in dict_:
-        if isinstance(dict_[k], dict):
-            yield from _keys_helper(dict_[k], key + (k,))
-        yield key + (k,)
+class _NamespaceDict(MutableMapping):
+    """A nested dictionary which can be nested indexed by tuples.
 
+    Values are stored in a flat `dict` keyed by their full namespace. The
+    number of stored namespaces below every partial namespace is tracked as
+    well, so membership tests for full and partial namespaces are a single
+    lookup. Setting a non-empty `dict` value stores each of its nested values
+    under its own namespace.
 
-class _NamespaceDict(MutableMapping):
-    """A nested dictionary which can be nested indexed by tuples."""
+    Iteration yields both partial and full namespaces, while the length is the
+    number of stored values.
+    """
 
     def __init__(self, dict_=None):
-        self._dict = {} if dict_ is None else dict_
+        self._flat = {}
+        self._prefixes = {}
+        if dict_ is not None:
+            for key, value in dict_.items():
+                self._setitem((key,), value)
 
     def __len__(self):
-        return dict_fold(self._dict, lambda x, incr: incr + 1, 0)
+        return len(self._flat)
 
     def __iter__(self):
-        yield from _keys_helper(self._dict)
-
-    def _pop_namespace(self, namespace):
-        return (namespace[-1], namespace[:-1])
+        yield from self._prefixes
+        yield from self._flat
 
     def _setitem(self, namespace, value):
-        # Grab parent dictionary creating sub dictionaries as necessary
-        parent_dict = self._dict
-        base_name, parent_namespace = self._pop_namespace(namespace)
-        for name in parent_namespace:
-            # If key does not exist create key with empty dictionary
-            try:
-                parent_dict = parent_dict[name]
-            except KeyError:
-                parent_dict[name] = dict()
-                parent_dict = parent_dict[name]
-        # Attempt to set the value
-        parent_dict[base_name] = value
+        flat = self._flat
+        if isinstance(value, dict) and value:
+            # Replace whatever is currently stored at namespace.
+            if namespace in flat:
+                self._delete_leaf(namespace)
+            elif namespace in self._prefixes:
+                self._delete_prefix(namespace)
+            for key, inner in dict_flatten(value).items():
+                self._setitem(namespace + key, inner)
+            return
+        if namespace in flat:
+            flat[namespace] = value
+            return
+        # Setting a partial namespace replaces everything stored below it.
+        if namespace in self._prefixes:
+            self._delete_prefix(namespace)
+        parents = [namespace[:i] for i in range(1, len(namespace))]
+        for parent in parents:
+            if parent in flat:
+                raise KeyError(
+                    "Namespace {} already stores a value.".format(parent))
+        prefixes = self._prefixes
+        for parent in parents:
+            prefixes[parent] = prefixes.get(parent, 0) + 1
+        flat[namespace] = value
 
     def __setitem__(self, namespace, value):
         try:
@@ -197,40 +240,57 @@ class _NamespaceDict(MutableMapping):
         return self._unsafe_getitem(namespace)
 
     def _unsafe_getitem(self, namespace):
-        ret_val = self._dict
         if isinstance(namespace, str):
             namespace = (namespace,)
         try:
-            for name in namespace:
-                ret_val = ret_val[name]
-        except (TypeError, KeyError):
+            return self._flat[namespace]
+        except KeyError:
+            if namespace not in self._prefixes:
+                raise KeyError(
+                    "Namespace {} not in dictionary.".format(namespace))
+        except TypeError:
             raise KeyError("Namespace {} not in dictionary.".format(namespace))
-        return ret_val
+        # Build the nested dictionary of values below a partial namespace.
+        start = len(namespace)
+        return _dict_unflatten(((key, value)
+                                for key, value in self._flat.items()
+                                if key[:start] == namespace), start)
+
+    def _delete_leaf(self, namespace):
+        del self._flat[namespace]
+        prefixes = self._prefixes
+        for i in range(1, len(namespace)):
+            parent = namespace[:i]
+            count = prefixes[parent] - 1
+            if count == 0:
+                del prefixes[parent]
+            else:
+                prefixes[parent] = count
+
+    def _delete_prefix(self, namespace):
+        start = len(namespace)
+        for key in [k for k in self._flat if k[:start] == namespace]:
+            self._delete_leaf(key)
 
     def __delitem__(self, namespace):
-        """Does not check that key exists."""
         if isinstance(namespace, str):
             namespace = (namespace,)
-        parent_dict = self._unsafe_getitem(namespace[:-1])
-        del parent_dict[namespace[-1]]
+        if namespace in self._flat:
+            self._delete_leaf(namespace)
+        elif namespace in self._prefixes:
+            self._delete_prefix(namespace)
+        else:
+            raise KeyError("Namespace {} not in dictionary.".format(namespace))
 
     def __contains__(self, namespace):
+        if isinstance(namespace, str):
+            namespace = (namespace,)
+        elif not isinstance(namespace, tuple):
+            return False
         try:
-            namespace = self.validate_namespace(namespace)
-        except ValueError:
+            return namespace in self._flat or namespace in self._prefixes
+        except TypeError:
             return False
-        current_dict = self._dict
-        # traverse through dictionary hierarchy
-        for name in namespace:
-            try:
-                if name in current_dict:
-                    current_dict = current_dict[name]
-                    continue
-                else:
-                    return False
-            except (TypeError, AttributeError):
-                return False
-        return True
 
     def validate_namespace(self, namespace):
         if isinstance(namespace, str):